@@ -1,6 +1,13 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import altair as alt
+import os
+import tempfile
 from pathlib import Path
 from io import BytesIO
 from datetime import datetime
@@ -19,6 +26,44 @@ except Exception:
 # ------------------------------
 DATA_PATH = Path("data/diabetic_data.csv")
 
+# Columns the KPI/chart pages use; the shared frame reads only these from Parquet
+USED_COLS = (
+    "encounter_id",
+    "patient_nbr",
+    "age",
+    "gender",
+    "admission_type_id",
+    "time_in_hospital",
+    "num_medications",
+    "readmitted",
+    "race",
+)
+
+# Column dtypes: categoricals for low-cardinality strings, smallest unsigned ints
+DTYPE = {
+    "age": "category",
+    "gender": "category",
+    "readmitted": "category",
+    "race": "category",
+    "admission_type_id": "uint8",
+    "time_in_hospital": "uint8",
+    "num_medications": "uint16",
+}
+
+# Age buckets in clinical order, used for the ordered age_group categorical
+AGE_ORDER = (
+    "[0-10)",
+    "[10-20)",
+    "[20-30)",
+    "[30-40)",
+    "[40-50)",
+    "[50-60)",
+    "[60-70)",
+    "[70-80)",
+    "[80-90)",
+    "[90-100)",
+)
+
 # Mapping from admission_type_id to readable labels
 ADMISSION_TYPE_LABELS = {
     1: "Emergency",
@@ -36,22 +81,111 @@ ADMISSION_TYPE_LABELS = {
 # ------------------------------
 # DATA LOADING
 # ------------------------------
-@st.cache_data
-def load_data(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+def _parquet_is_stale(csv_path: Path, parquet_path: Path) -> bool:
+    """Return True if the Parquet cache is missing, older than the CSV or lacks columns."""
+    if not parquet_path.exists():
+        return True
+    if csv_path.stat().st_mtime > parquet_path.stat().st_mtime:
+        return True
+    csv_cols = pd.read_csv(csv_path, nrows=0).columns
+    try:
+        parquet_cols = pq.read_schema(parquet_path).names
+    except pa.ArrowInvalid:
+        # Truncated or corrupt file, e.g. from an interrupted conversion
+        return True
+    return not set(csv_cols).issubset(parquet_cols)
+
+
+def _ensure_parquet(path: Path) -> Path:
+    """Convert the full source CSV to a sibling Parquet file when stale; return its path.
+
+    The file is written to a temp file in the same directory and renamed into
+    place, so readers never see a partial file. Raises ``OSError`` if the
+    directory is not writable.
+    """
+    parquet_path = path.with_suffix(".parquet")
+    if _parquet_is_stale(path, parquet_path):
+        fd, tmp_path = tempfile.mkstemp(
+            dir=parquet_path.parent, prefix=f".{parquet_path.stem}.", suffix=".parquet"
+        )
+        os.close(fd)
+        try:
+            df = pd.read_csv(path, dtype=DTYPE, engine="c")
+            df.to_parquet(tmp_path, engine="pyarrow", index=False, compression="zstd")
+            os.replace(tmp_path, parquet_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+    return parquet_path
+
+
+def _read_source(path: Path, columns: tuple | None = None) -> pd.DataFrame:
+    """Read ``columns`` (default: all) via the Parquet cache, or straight from the CSV.
+
+    Falls back to the CSV when the Parquet file cannot be written, e.g. on a
+    read-only data directory.
+    """
+    try:
+        parquet_path = _ensure_parquet(path)
+    except OSError:
+        return pd.read_csv(path, usecols=columns, dtype=DTYPE, engine="c")
+    return pd.read_parquet(
+        parquet_path,
+        columns=list(columns) if columns is not None else None,
+        engine="pyarrow",
+        memory_map=True,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _load_data_resource(path: Path) -> pd.DataFrame:
+    """Load the dataset once per process; the frame is shared across sessions."""
+    df = _read_source(path, USED_COLS)
 
-    # Ensure num_medications is numeric
-    if "num_medications" not in df.columns:
-        raise ValueError("Expected 'num_medications' column not found in CSV.")
-    df["num_medications"] = pd.to_numeric(df["num_medications"], errors="coerce")
+    # No-op for Parquet written by _ensure_parquet; fixes up older untyped files
+    df = df.astype(DTYPE)
 
     # Age groups are already bucketed in this dataset
-    df["age_group"] = df["age"].astype(str)
+    df["age_group"] = pd.Categorical(df["age"], categories=AGE_ORDER, ordered=True)
+
+    # 30-day readmission flag, computed once so pages never compare strings
+    df["readmitted_30"] = (df["readmitted"] == "<30").to_numpy().astype(np.uint8)
 
     return df
 
 
-df_raw = load_data(DATA_PATH)
+@st.cache_resource(show_spinner=False)
+def _load_explorer_resource(path: Path) -> pd.DataFrame:
+    """Load every source column once per process for the Data Explorer.
+
+    Row order matches ``_load_data_resource``, so ``_filter_mask`` applies
+    to both frames.
+    """
+    df = _read_source(path)
+    df = df.astype(DTYPE)
+
+    # Remaining text columns (diagnoses, medications, ...) are low-cardinality
+    text_cols = df.select_dtypes("object").columns
+    df[text_cols] = df[text_cols].astype("category")
+
+    df["age_group"] = pd.Categorical(df["age"], categories=AGE_ORDER, ordered=True)
+    return df
+
+
+def get_df_raw() -> pd.DataFrame:
+    """Return the full shared dataset (read-only; ``.copy()`` before mutating)."""
+    return _load_data_resource(DATA_PATH)
+
+
+@st.cache_data(show_spinner=False)
+def _filter_domains() -> tuple[tuple, tuple, tuple]:
+    """Return the sorted age group, gender and admission type filter options."""
+    df_raw = get_df_raw()
+    return (
+        tuple(sorted(df_raw["age_group"].cat.categories)),
+        tuple(sorted(df_raw["gender"].cat.categories)),
+        tuple(sorted(df_raw["admission_type_id"].unique().tolist())),
+    )
 
 
 # ------------------------------
@@ -68,13 +202,16 @@ def get_theme(dark_mode: bool = False) -> dict:
     }
 
 
-def apply_theme_css(theme: dict) -> None:
-    """Inject CSS for the light theme."""
+@st.cache_resource(show_spinner=False)
+def _css_block(theme: dict) -> str:
+    """Build the light-theme <style> block once per process."""
     APP_BG = theme["APP_BG"]
     TEXT_COLOR = theme["TEXT_COLOR"]
+    CARD_GRADIENT = theme["CARD_GRADIENT"]
+    BORDER = theme["BORDER"]
+    SUBTXT = theme["SUBTXT"]
 
-    st.markdown(
-        f"""
+    return f"""
         <style>
         .stApp {{
             background-color: {APP_BG};
@@ -84,24 +221,67 @@ def apply_theme_css(theme: dict) -> None:
             transition: background-color 0.3s ease, color 0.3s ease;
         }}
         .kpi-card {{
+            background: {CARD_GRADIENT};
+            padding: 1.5rem;
+            border-radius: 20px;
+            border: 1px solid {BORDER};
+            text-align: center;
             transition: transform 0.2s ease-out, box-shadow 0.2s ease-out;
         }}
+        .kpi-card h4 {{
+            margin-top: 10px;
+        }}
+        .kpi-card p {{
+            color: {SUBTXT};
+            font-size: 0.9rem;
+        }}
+        .kpi-gauge {{
+            width: 90px;
+            height: 90px;
+            margin: auto;
+            border-radius: 50%;
+            background: conic-gradient(var(--c) var(--deg), #e5e7eb 0deg);
+        }}
+        .kpi-inner {{
+            width: 70px;
+            height: 70px;
+            margin: 10px auto;
+            border-radius: 50%;
+            background: rgba(255,255,255,0.7);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-weight: 700;
+            font-size: 1.4rem;
+            color: {TEXT_COLOR};
+        }}
+        .kpi-unit {{
+            font-size: 0.75rem;
+        }}
         .kpi-card:hover {{
             transform: translateY(-4px);
             box-shadow: 0 12px 30px rgba(15,23,42,0.15);
         }}
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
+
+
+def apply_theme_css(theme: dict) -> None:
+    """Inject CSS for the light theme.
+
+    Emitted on every run: Streamlit removes elements a rerun does not
+    re-emit, so skipping this would drop the styles.
+    """
+    st.markdown(_css_block(theme), unsafe_allow_html=True)
 
 
 # ------------------------------
 # FILTERS (USED BY ALL PAGES)
 # ------------------------------
-def get_filtered_data() -> pd.DataFrame:
-    """Draw sidebar filters and return filtered dataframe."""
+def get_filters() -> tuple[tuple, tuple, tuple]:
+    """Draw sidebar filters and return the selected (age, gender, admission) values."""
     st.sidebar.markdown("## Filters")
+    age_groups, genders, adm_types = _filter_domains()
 
     # Reset filters
     if st.sidebar.button("Reset All Filters"):
@@ -112,7 +292,6 @@ def get_filtered_data() -> pd.DataFrame:
 
     # --- Age Group filter ---
     with st.sidebar.expander("Age Group", expanded=False):
-        age_groups = sorted(df_raw["age_group"].dropna().unique())
         all_age = st.checkbox("Select All", value=True, key="all_age")
         if all_age:
             age_selected = age_groups
@@ -121,7 +300,6 @@ def get_filtered_data() -> pd.DataFrame:
 
     # --- Gender filter ---
     with st.sidebar.expander("Gender", expanded=False):
-        genders = sorted(df_raw["gender"].dropna().unique())
         all_gender = st.checkbox("Select All", value=True, key="all_gender")
         if all_gender:
             gender_selected = genders
@@ -132,7 +310,6 @@ def get_filtered_data() -> pd.DataFrame:
 
     # --- Admission Type filter (with labels) ---
     with st.sidebar.expander("Admission Type", expanded=False):
-        adm_types = sorted(df_raw["admission_type_id"].dropna().unique())
         all_adm = st.checkbox("Select All", value=True, key="all_adm")
         if all_adm:
             adm_selected = adm_types
@@ -143,42 +320,86 @@ def get_filtered_data() -> pd.DataFrame:
                 if st.checkbox(label, key=f"adm_{a}"):
                     adm_selected.append(a)
 
-    # Apply filters
-    df = df_raw[
-        df_raw["age_group"].isin(age_selected)
-        & df_raw["gender"].isin(gender_selected)
-        & df_raw["admission_type_id"].isin(adm_selected)
-    ].copy()
+    return (
+        tuple(sorted(age_selected)),
+        tuple(sorted(gender_selected)),
+        tuple(sorted(int(a) for a in adm_selected)),
+    )
 
-    return df
+
+# Cached helpers take the (age, gender, adm) filter tuples, never DataFrames, so
+# cache keys hash in constant time regardless of how many rows are selected.
+def _filter_mask(age: tuple, gender: tuple, adm: tuple) -> np.ndarray:
+    """Return a boolean mask over the full dataset for the selected filter values."""
+    df_raw = get_df_raw()
+    return (
+        df_raw["age_group"].isin(age).to_numpy()
+        & df_raw["gender"].isin(gender).to_numpy()
+        & df_raw["admission_type_id"].isin(adm).to_numpy()
+    )
+
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def _apply_filters(age: tuple, gender: tuple, adm: tuple) -> pd.DataFrame:
+    """Return the rows of the full dataset matching the selected filter values.
+
+    Cached on the filter tuples only, since the full dataset is loaded once
+    and never mutated. After the source data changes, call both
+    ``st.cache_resource.clear()`` (the loaded frames) and
+    ``st.cache_data.clear()`` (results derived from them).
+    """
+    return get_df_raw()[_filter_mask(age, gender, adm)]
+
+
+@st.cache_data(show_spinner=False)
+def filtered_count(age: tuple, gender: tuple, adm: tuple) -> int:
+    """Return the number of rows matching the filters without building the frame."""
+    return int(np.count_nonzero(_filter_mask(age, gender, adm)))
+
+
+def get_filtered_data(filters: tuple[tuple, tuple, tuple]) -> pd.DataFrame:
+    """Return the filtered dataframe for filters from ``get_filters``."""
+    return _apply_filters(*filters)
+
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def _explorer_rows(age: tuple, gender: tuple, adm: tuple) -> pd.DataFrame:
+    """Return the filtered rows shown, searched and exported by the Data Explorer.
+
+    Uses the full-width frame, so every source column is kept and derived
+    helper columns such as ``readmitted_30`` are not.
+    """
+    return _load_explorer_resource(DATA_PATH)[_filter_mask(age, gender, adm)]
 
 
 # ------------------------------
 # KPI / METRIC HELPERS
 # ------------------------------
-def gauge_style(pct: float, color: str) -> str:
-    """Create a CSS conic-gradient for KPI donut gauge."""
-    pct = max(0, min(100, pct))
-    deg = pct * 3.6
-    return f"background: conic-gradient({color} {deg}deg, #e5e7eb 0deg);"
+def kpi_card_html(
+    value: float, unit: str, pct: float, color: str, title: str, caption: str
+) -> str:
+    """Return the markup for one KPI card; styling lives in apply_theme_css."""
+    deg = max(0, min(100, pct)) * 3.6
+    return (
+        f"<div class='kpi-card'><div class='kpi-gauge' style='--c:{color};--deg:{deg:.1f}deg'>"
+        f"<div class='kpi-inner'>{value}<span class='kpi-unit'>{unit}</span></div></div>"
+        f"<h4>{title}</h4><p>{caption}</p></div>"
+    )
 
 
 def compute_kpis(df: pd.DataFrame) -> dict:
     """Compute all main KPIs and return as a dict."""
 
-    if len(df) > 0:
-        readmission_rate = (df["readmitted"] == "<30").mean() * 100
-    else:
-        readmission_rate = 0.0
+    readmitted_30 = df["readmitted_30"].to_numpy()
+    readmission_rate = np.count_nonzero(readmitted_30) / max(len(df), 1) * 100.0
     readmission_rate = round(readmission_rate, 1)
 
     readmitted_df = df[df["readmitted"].isin(["<30", ">30"])]
 
     if len(readmitted_df) > 0:
-        avg_los_readmitted = round(readmitted_df["time_in_hospital"].mean(), 1)
-        polypharmacy_rate = (
-            readmitted_df["num_medications"] >= 10
-        ).mean() * 100
+        avg_los_readmitted = round(readmitted_df["time_in_hospital"].to_numpy().mean(), 1)
+        meds = readmitted_df["num_medications"].to_numpy()
+        polypharmacy_rate = np.count_nonzero(meds >= 10) / len(meds) * 100.0
     else:
         avg_los_readmitted = 0.0
         polypharmacy_rate = 0.0
@@ -193,10 +414,37 @@ def compute_kpis(df: pd.DataFrame) -> dict:
     }
 
 
-def build_kpi_excel(
-    df: pd.DataFrame, readmitted_df: pd.DataFrame, kpis: dict
-) -> BytesIO:
-    """Create an Excel file with KPI summary."""
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def compute_kpis_cached(age: tuple, gender: tuple, adm: tuple) -> dict:
+    """Cached ``compute_kpis`` for the frame selected by the given filters."""
+    return compute_kpis(_apply_filters(age, gender, adm))
+
+
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a frame to CSV bytes via Arrow."""
+    buf = BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue()
+
+
+# Full-width exports run to ~26 MB each, so keep only a few; searched exports
+# are built uncached in _search_block rather than adding one entry per term.
+@st.cache_data(ttl=600, max_entries=4, show_spinner=False)
+def _csv_bytes(age: tuple, gender: tuple, adm: tuple) -> bytes:
+    """Serialize the filtered rows to CSV bytes."""
+    return _to_csv_bytes(_explorer_rows(age, gender, adm))
+
+
+# Reports stay in RAM up to this size and spill to a temp file beyond it
+REPORT_SPOOL_MAX_SIZE = 1 << 20
+
+
+def build_kpi_excel(kpi_tuple: tuple, n_df: int, n_readm: int) -> bytes:
+    """Create an Excel file with KPI summary.
+
+    ``kpi_tuple`` is (readmission_rate, avg_los_readmitted, polypharmacy_rate).
+    """
+    readmission_rate, avg_los_readmitted, polypharmacy_rate = kpi_tuple
     data = {
         "Metric": [
             "30-Day Readmission Rate (<30 / all encounters)",
@@ -206,71 +454,213 @@ def build_kpi_excel(
             "Filtered Readmitted Encounters",
         ],
         "Value": [
-            f"{kpis['readmission_rate']} %",
-            kpis["avg_los_readmitted"],
-            f"{kpis['polypharmacy_rate']} %",
-            len(df),
-            len(readmitted_df),
+            f"{readmission_rate} %",
+            avg_los_readmitted,
+            f"{polypharmacy_rate} %",
+            n_df,
+            n_readm,
         ],
     }
-    out = BytesIO()
-    with pd.ExcelWriter(out, engine="openpyxl") as writer:
-        pd.DataFrame(data).to_excel(writer, index=False, sheet_name="KPI Summary")
-    out.seek(0)
-    return out
+    with tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_SIZE) as out:
+        with pd.ExcelWriter(
+            out,
+            engine="xlsxwriter",
+            engine_kwargs={"options": {"constant_memory": True}},
+        ) as writer:
+            pd.DataFrame(data).to_excel(writer, index=False, sheet_name="KPI Summary")
+        out.seek(0)
+        return out.read()
 
 
 def build_pdf(
-    df: pd.DataFrame, readmitted_df: pd.DataFrame, kpis: dict
-) -> BytesIO | None:
-    """Create a simple PDF KPI report (if reportlab is installed)."""
+    kpi_tuple: tuple, n_df: int, n_readm: int, generated: str | None = None
+) -> bytes | None:
+    """Create a simple PDF KPI report (if reportlab is installed).
+
+    ``generated`` is the timestamp printed in the header; defaults to now.
+    """
     if not REPORTLAB_AVAILABLE:
         return None
 
-    readmission_rate = kpis["readmission_rate"]
-    avg_los_readmitted = kpis["avg_los_readmitted"]
-    polypharmacy_rate = kpis["polypharmacy_rate"]
+    if generated is None:
+        generated = datetime.now().strftime("%Y-%m-%d %H:%M")
 
-    buf = BytesIO()
-    c = canvas.Canvas(buf, pagesize=letter)
-    width, height = letter
-
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(40, height - 40, "Diabetes Care Performance Report")
-    c.setFont("Helvetica", 10)
-    c.drawString(
-        40,
-        height - 60,
-        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+    readmission_rate, avg_los_readmitted, polypharmacy_rate = kpi_tuple
+
+    with tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_SIZE) as buf:
+        c = canvas.Canvas(buf, pagesize=letter)
+        width, height = letter
+
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(40, height - 40, "Diabetes Care Performance Report")
+        c.setFont("Helvetica", 10)
+        c.drawString(40, height - 60, f"Generated: {generated}")
+
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(40, height - 90, "Key Performance Indicators")
+        c.setFont("Helvetica", 10)
+        c.drawString(60, height - 110, f"30-Day Readmission Rate: {readmission_rate}%")
+        c.drawString(
+            60,
+            height - 125,
+            f"Average LOS (readmitted): {avg_los_readmitted} days",
+        )
+        c.drawString(
+            60,
+            height - 140,
+            f"Polypharmacy (≥10 meds, readmitted): {polypharmacy_rate}%",
+        )
+        c.drawString(60, height - 160, f"Filtered Encounters: {n_df}")
+        c.drawString(60, height - 175, f"Filtered Readmitted Encounters: {n_readm}")
+
+        c.showPage()
+        c.save()
+        buf.seek(0)
+        return buf.read()
+
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def _excel_bytes(kpi_tuple: tuple, n_df: int, n_readm: int) -> bytes:
+    """Cached KPI Excel bytes, keyed on the scalar KPI values only."""
+    return build_kpi_excel(kpi_tuple, n_df, n_readm)
+
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def _pdf_bytes(
+    kpi_tuple: tuple, n_df: int, n_readm: int, generated: str
+) -> bytes | None:
+    """Cached KPI PDF bytes, keyed on the KPI values and the minute-level timestamp."""
+    return build_pdf(kpi_tuple, n_df, n_readm, generated)
+
+
+def _bin_counts(values: pd.Series, edges: list) -> np.ndarray:
+    """Count values per right-closed bin (edges[i], edges[i + 1]], like ``pd.cut``."""
+    idx = np.searchsorted(edges, values.to_numpy(), side="left") - 1
+    idx = idx[(idx >= 0) & (idx < len(edges) - 1)]
+    return np.bincount(idx, minlength=len(edges) - 1)
+
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def _overview_dists(
+    age: tuple, gender: tuple, adm: tuple
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Return the readmission, LOS and polypharmacy distributions for the Overview tabs."""
+    df = _apply_filters(age, gender, adm)
+    readmitted_df = compute_kpis_cached(age, gender, adm)["readmitted_df"]
+
+    # Group first, then relabel the (at most three) result rows
+    counts = (
+        df.groupby("readmitted", observed=True)
+        .size()
+        .sort_values(ascending=False)
+        .mul(100 / max(len(df), 1))
+    )
+    counts.index = counts.index.map(
+        {"NO": "No Readmission", "<30": "<30 Days", ">30": ">30 Days"}
+    )
+    dist = counts.rename_axis("Category").reset_index(name="Percent")
+
+    los_dist = pd.DataFrame(
+        {
+            "LOS": ["1–2", "3–4", "5–6", "7–8", "9–10", "10+"],
+            "Count": _bin_counts(df["time_in_hospital"], [0, 2, 4, 6, 8, 10, 20]),
+        }
+    )
+
+    poly_dist = pd.DataFrame(
+        {
+            "Med Bin": ["0–4", "5–9", "10–14", "15–19", "20–29", "30+"],
+            "Count": _bin_counts(
+                readmitted_df["num_medications"], [0, 5, 10, 15, 20, 30, 50]
+            ),
+        }
+    )
+
+    return dist, los_dist, poly_dist
+
+
+# ------------------------------
+# EDA AGGREGATES
+# ------------------------------
+# Facet labels for the LOS and medication histograms, in display order
+EDA_HIST_LABELS = ("LOS (days)", "Number of Medications")
+
+
+def _histogram_frame(arr: np.ndarray, bins: int) -> pd.DataFrame:
+    """Return up to ``bins`` equal-width bins as (bin_start, bin_end, count) rows.
+
+    Integer columns are counted per value with ``np.bincount`` and merged into
+    whole-number-wide bins, so no bin splits a value.
+    """
+    if len(arr) == 0 or not np.issubdtype(arr.dtype, np.integer):
+        counts, edges = np.histogram(arr, bins=bins)
+        return pd.DataFrame(
+            {"bin_start": edges[:-1], "bin_end": edges[1:], "count": counts}
+        )
+
+    lo, hi = int(arr.min()), int(arr.max())
+    step = -(-(hi - lo + 1) // bins)
+    n_bins = -(-(hi - lo + 1) // step)
+    per_value = np.bincount(arr - lo, minlength=n_bins * step)
+    bin_start = lo + step * np.arange(n_bins)
+    return pd.DataFrame(
+        {
+            "bin_start": bin_start,
+            "bin_end": bin_start + step,
+            "count": per_value.reshape(n_bins, step).sum(axis=1),
+        }
     )
 
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(40, height - 90, "Key Performance Indicators")
-    c.setFont("Helvetica", 10)
-    c.drawString(60, height - 110, f"30-Day Readmission Rate: {readmission_rate}%")
-    c.drawString(
-        60,
-        height - 125,
-        f"Average LOS (readmitted): {avg_los_readmitted} days",
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def eda_summaries(
+    age: tuple, gender: tuple, adm: tuple
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Return the LOS/medication histograms and the age-group readmission rates.
+
+    Both histograms come back in one frame, told apart by its ``variable``
+    column, so they can be drawn as a single faceted chart.
+
+    Aggregates straight from the filter mask over the four columns involved,
+    without materializing the filtered frame.
+    """
+    df_raw = get_df_raw()
+    mask = _filter_mask(age, gender, adm)
+
+    los_bins = _histogram_frame(df_raw["time_in_hospital"].to_numpy()[mask], bins=20)
+    meds_bins = _histogram_frame(df_raw["num_medications"].to_numpy()[mask], bins=30)
+    hist_bins = pd.concat(
+        [
+            los_bins.assign(variable=EDA_HIST_LABELS[0]),
+            meds_bins.assign(variable=EDA_HIST_LABELS[1]),
+        ],
+        ignore_index=True,
     )
-    c.drawString(
-        60,
-        height - 140,
-        f"Polypharmacy (≥10 meds, readmitted): {polypharmacy_rate}%",
+
+    # Per-group rate in one sweep: bincount (code, hit) pairs packed as 2 * code + hit
+    age_groups = df_raw["age_group"].cat.categories
+    codes = df_raw["age_group"].cat.codes.to_numpy()[mask]
+    hit = df_raw["readmitted_30"].to_numpy()[mask]
+    valid = codes >= 0
+    pairs = codes[valid].astype(np.intp) * 2 + hit[valid]
+    pair_counts = np.bincount(pairs, minlength=2 * len(age_groups)).reshape(-1, 2)
+    num = pair_counts[:, 1]
+    den = pair_counts.sum(axis=1)
+    observed = den > 0
+    age_readmit = pd.DataFrame(
+        {
+            "age_group": age_groups[observed],
+            "readmitted_30": 100 * num[observed] / den[observed],
+        }
     )
-    c.drawString(60, height - 160, f"Filtered Encounters: {len(df)}")
-    c.drawString(60, height - 175, f"Filtered Readmitted Encounters: {len(readmitted_df)}")
 
-    c.showPage()
-    c.save()
-    buf.seek(0)
-    return buf
+    return hist_bins, age_readmit
 
 
 # ------------------------------
 # PAGE RENDERERS (from old app)
 # ------------------------------
-def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
+def show_overview(theme: dict, df: pd.DataFrame, kpis: dict, filters: tuple) -> None:
     """Render the Overview page (UI copied from original single-file app)."""
     TEXT_COLOR = theme["TEXT_COLOR"]
     SUBTXT = theme["SUBTXT"]
@@ -302,15 +692,19 @@ def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
         if st.button("🔍 About This Dashboard"):
             st.session_state["show_about"] = not st.session_state.get("show_about", False)
 
+    kpi_tuple = (readmission_rate, avg_los_readmitted, polypharmacy_rate)
+    n_df, n_readm = len(df), len(readmitted_df)
+
     with header_right:
         st.download_button(
             "Download KPI Summary (Excel)",
-            data=build_kpi_excel(df, readmitted_df, kpis),
+            data=_excel_bytes(kpi_tuple, n_df, n_readm),
             file_name="kpi_summary.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         )
         if REPORTLAB_AVAILABLE:
-            pdf_bytes = build_pdf(df, readmitted_df, kpis)
+            generated = datetime.now().strftime("%Y-%m-%d %H:%M")
+            pdf_bytes = _pdf_bytes(kpi_tuple, n_df, n_readm, generated)
             st.download_button(
                 "Download KPI Report (PDF)",
                 data=pdf_bytes,
@@ -353,71 +747,41 @@ def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
 
     with k1:
         st.markdown(
-            f"""
-            <div class="kpi-card" style='background:{CARD_GRADIENT}; padding:1.5rem;
-                        border-radius:20px; border:1px solid {BORDER}; text-align:center;'>
-                <div style='width:90px; height:90px; margin:auto; border-radius:50%;
-                            {gauge_style(readmission_rate, readmit_color)}'>
-                    <div style='width:70px; height:70px; margin:10px auto; border-radius:50%;
-                                background:rgba(255,255,255,0.7);
-                                display:flex; align-items:center; justify-content:center;
-                                font-weight:700; font-size:1.4rem; color:{TEXT_COLOR};'>
-                        {readmission_rate}<span style='font-size:0.75rem;'>%</span>
-                    </div>
-                </div>
-                <h4 style='margin-top:10px;'>30-Day Readmission Rate</h4>
-                <p style='color:{SUBTXT}; font-size:0.9rem;'>
-                    Percentage of encounters readmitted within 30 days.
-                </p>
-            </div>
-            """,
+            kpi_card_html(
+                readmission_rate,
+                "%",
+                readmission_rate,
+                readmit_color,
+                "30-Day Readmission Rate",
+                "Percentage of encounters readmitted within 30 days.",
+            ),
             unsafe_allow_html=True,
         )
 
     with k2:
         st.markdown(
-            f"""
-            <div class="kpi-card" style='background:{CARD_GRADIENT}; padding:1.5rem;
-                        border-radius:20px; border:1px solid {BORDER}; text-align:center;'>
-                <div style='width:90px; height:90px; margin:auto; border-radius:50%;
-                            {gauge_style(avg_los_readmitted * 7, los_color)}'>
-                    <div style='width:70px; height:70px; margin:10px auto; border-radius:50%;
-                                background:rgba(255,255,255,0.7);
-                                display:flex; align-items:center; justify-content:center;
-                                font-weight:700; font-size:1.4rem; color:{TEXT_COLOR};'>
-                        {avg_los_readmitted}<span style='font-size:0.75rem;'> days</span>
-                    </div>
-                </div>
-                <h4 style='margin-top:10px;'>Average Length of Stay (Readmitted)</h4>
-                <p style='color:{SUBTXT}; font-size:0.9rem;'>
-                    Average inpatient stay duration (days) for readmitted encounters.
-                </p>
-            </div>
-            """,
+            kpi_card_html(
+                avg_los_readmitted,
+                " days",
+                avg_los_readmitted * 7,
+                los_color,
+                "Average Length of Stay (Readmitted)",
+                "Average inpatient stay duration (days) for readmitted encounters.",
+            ),
             unsafe_allow_html=True,
         )
 
     with k3:
         st.markdown(
-            f"""
-            <div class="kpi-card" style='background:{CARD_GRADIENT}; padding:1.5rem;
-                        border-radius:20px; border:1px solid {BORDER}; text-align:center;'>
-                <div style='width:90px; height:90px; margin:auto; border-radius:50%;
-                            {gauge_style(polypharmacy_rate, poly_color)}'>
-                    <div style='width:70px; height:70px; margin:10px auto; border-radius:50%;
-                                background:rgba(255,255,255,0.7);
-                                display:flex; align-items:center; justify-content:center;
-                                font-weight:700; font-size:1.4rem; color:{TEXT_COLOR};'>
-                        {polypharmacy_rate}<span style='font-size:0.75rem;'>%</span>
-                    </div>
-                </div>
-                <h4 style='margin-top:10px;'>Polypharmacy (Readmitted)</h4>
-                <p style='color:{SUBTXT}; font-size:0.9rem;'>
-                    Percentage of readmitted patients (&#60;30 or &#62;30 days)
-                    receiving 10+ medications.
-                </p>
-            </div>
-            """,
+            kpi_card_html(
+                polypharmacy_rate,
+                "%",
+                polypharmacy_rate,
+                poly_color,
+                "Polypharmacy (Readmitted)",
+                "Percentage of readmitted patients (&#60;30 or &#62;30 days) "
+                "receiving 10+ medications.",
+            ),
             unsafe_allow_html=True,
         )
 
@@ -440,16 +804,10 @@ def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
         ["📉 Readmission", "🏥 LOS", "💊 Polypharmacy (Readmitted)"]
     )
 
+    dist, los_dist, poly_dist = _overview_dists(*filters)
+
     with tab1:
         if len(df) > 0:
-            dist = (
-                df["readmitted"]
-                .replace({"NO": "No Readmission", "<30": "<30 Days", ">30": ">30 Days"})
-                .value_counts(normalize=True)
-                .mul(100)
-                .reset_index()
-            )
-            dist.columns = ["Category", "Percent"]
             chart = (
                 alt.Chart(dist)
                 .mark_bar(color="#ef4444")
@@ -465,13 +823,6 @@ def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
 
     with tab2:
         if len(df) > 0:
-            los_bins = pd.cut(
-                df["time_in_hospital"],
-                bins=[0, 2, 4, 6, 8, 10, 20],
-                labels=["1–2", "3–4", "5–6", "7–8", "9–10", "10+"],
-            )
-            los_dist = los_bins.value_counts().sort_index().reset_index()
-            los_dist.columns = ["LOS", "Count"]
             chart2 = (
                 alt.Chart(los_dist)
                 .mark_bar(color="#3b82f6")
@@ -487,13 +838,6 @@ def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
 
     with tab3:
         if len(readmitted_df) > 0:
-            poly_bins = pd.cut(
-                readmitted_df["num_medications"],
-                bins=[0, 5, 10, 15, 20, 30, 50],
-                labels=["0–4", "5–9", "10–14", "15–19", "20–29", "30+"],
-            )
-            poly_dist = poly_bins.value_counts().sort_index().reset_index()
-            poly_dist.columns = ["Med Bin", "Count"]
             chart3 = (
                 alt.Chart(poly_dist)
                 .mark_bar(color="#22c55e")
@@ -510,14 +854,11 @@ def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
     # Odds ratio section
     with st.expander("Polypharmacy & 30-Day Readmission (Odds Ratio)", expanded=False):
         if len(df) > 0:
-            temp = df.copy()
-            temp["polypharmacy"] = temp["num_medications"] >= 10
-            temp["readmitted_30_flag"] = temp["readmitted"] == "<30"
-
-            a = ((temp["polypharmacy"]) & (temp["readmitted_30_flag"])).sum()
-            b = ((temp["polypharmacy"]) & (~temp["readmitted_30_flag"])).sum()
-            c = ((~temp["polypharmacy"]) & (temp["readmitted_30_flag"])).sum()
-            d = ((~temp["polypharmacy"]) & (~temp["readmitted_30_flag"])).sum()
+            # 2x2 table in one pass: code = 2 * polypharmacy + readmitted_30
+            poly = (df["num_medications"] >= 10).to_numpy()
+            flag = df["readmitted_30"].to_numpy()
+            code = poly.astype(np.uint8) * 2 + flag
+            d, c, b, a = np.bincount(code, minlength=4)
 
             def adj(x: int) -> float:
                 return x if x > 0 else 0.5
@@ -547,7 +888,7 @@ def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
     # Download filtered data
     st.download_button(
         "Download Filtered Dataset (CSV)",
-        df.to_csv(index=False).encode("utf-8"),
+        _csv_bytes(*filters),
         "filtered_data_overview.csv",
         "text/csv",
     )
@@ -651,30 +992,53 @@ def show_overview(theme: dict, df: pd.DataFrame, kpis: dict) -> None:
     )
 
 
-def show_data_explorer(df: pd.DataFrame, kpis: dict) -> None:
-    readmitted_df = kpis["readmitted_df"]
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def _search_rows(search: str, age: tuple, gender: tuple, adm: tuple) -> pd.DataFrame:
+    """Return filtered rows where any column contains ``search`` (case-insensitive)."""
+    df = _explorer_rows(age, gender, adm)
+    mask = np.zeros(len(df), dtype=bool)
+    for col in df.columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # Match each category once, then broadcast through the codes (-1 = missing)
+            categories = pa.array(s.cat.categories.astype(str))
+            hits = pc.match_substring(categories, search, ignore_case=True)
+            hits = np.append(hits.to_numpy(zero_copy_only=False), False)
+            mask |= hits[s.cat.codes.to_numpy()]
+        else:
+            values = pc.cast(pa.array(s), pa.string())
+            hits = pc.match_substring(values, search, ignore_case=True)
+            mask |= pc.fill_null(hits, False).to_numpy(zero_copy_only=False)
+    return df[mask]
 
-    st.title("Data Explorer")
 
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def _readmitted_patient_ids(age: tuple, gender: tuple, adm: tuple) -> list[int]:
+    """Return the distinct patient numbers among readmitted encounters."""
+    readmitted_df = compute_kpis_cached(age, gender, adm)["readmitted_df"]
+    return readmitted_df["patient_nbr"].unique().tolist()
+
+
+@st.fragment
+def _search_block(filters: tuple) -> None:
+    """Global search + table; reruns on its own so typing skips the KPI pipeline."""
     search = st.text_input("Global search", placeholder="Search across all columns...")
-    df_view = df.copy()
-    if search:
-        mask = df_view.apply(
-            lambda col: col.astype(str).str.contains(search, case=False, na=False)
-        )
-        df_view = df_view[mask.any(axis=1)]
+    df_view = _search_rows(search, *filters) if search else _explorer_rows(*filters)
 
     st.write(f"Showing **{len(df_view)}** rows after filters and search.")
     st.download_button(
         "Download Filtered CSV",
-        df_view.to_csv(index=False).encode("utf-8"),
+        _to_csv_bytes(df_view) if search else _csv_bytes(*filters),
         "filtered_data.csv",
         "text/csv",
     )
 
     st.dataframe(df_view, use_container_width=True)
 
-    st.markdown("### Readmitted Patient Profile Explorer")
+
+@st.fragment
+def _patient_profile_block(readmitted_df: pd.DataFrame, filters: tuple) -> None:
+    """Patient selectbox + encounters table, rerun independently of the search block."""
     if len(readmitted_df) > 0:
         sample_cols = [
             "encounter_id",
@@ -686,14 +1050,12 @@ def show_data_explorer(df: pd.DataFrame, kpis: dict) -> None:
             "num_medications",
             "readmitted",
         ]
-        profile_df = readmitted_df[sample_cols].copy()
-        patient_ids = profile_df["patient_nbr"].astype(str).unique()
         selected_patient = st.selectbox(
             "Select a patient number (readmitted only):",
-            patient_ids,
+            _readmitted_patient_ids(*filters),
         )
-        selected_rows = profile_df[
-            profile_df["patient_nbr"].astype(str) == selected_patient
+        selected_rows = readmitted_df.loc[
+            readmitted_df["patient_nbr"] == selected_patient, sample_cols
         ]
         st.write("Selected patient encounters:")
         st.dataframe(selected_rows, use_container_width=True)
@@ -703,6 +1065,17 @@ def show_data_explorer(df: pd.DataFrame, kpis: dict) -> None:
         )
 
 
+def show_data_explorer(kpis: dict, filters: tuple) -> None:
+    readmitted_df = kpis["readmitted_df"]
+
+    st.title("Data Explorer")
+
+    _search_block(filters)
+
+    st.markdown("### Readmitted Patient Profile Explorer")
+    _patient_profile_block(readmitted_df, filters)
+
+
 def show_about_page() -> None:
     st.title("About This Dashboard")
 
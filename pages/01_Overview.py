@@ -2,15 +2,17 @@ import streamlit as st
 from core import (
     get_theme,
     apply_theme_css,
+    get_filters,
     get_filtered_data,
-    compute_kpis,
+    compute_kpis_cached,
     show_overview,
 )
 
 theme = get_theme(False)
 apply_theme_css(theme)
 
-df = get_filtered_data()
-kpis = compute_kpis(df)
+filters = get_filters()
+df = get_filtered_data(filters)
+kpis = compute_kpis_cached(*filters)
 
-show_overview(theme, df, kpis)
+show_overview(theme, df, kpis, filters)
@@ -2,15 +2,15 @@ import streamlit as st
 from core import (
     get_theme,
     apply_theme_css,
-    get_filtered_data,
-    compute_kpis,
+    get_filters,
+    compute_kpis_cached,
     show_data_explorer,
 )
 
 theme = get_theme(False)
 apply_theme_css(theme)
 
-df = get_filtered_data()
-kpis = compute_kpis(df)
+filters = get_filters()
+kpis = compute_kpis_cached(*filters)
 
-show_data_explorer(df, kpis)
+show_data_explorer(kpis, filters)
@@ -1,53 +1,89 @@
 import streamlit as st
-import altair as alt
-from core import get_theme, apply_theme_css, get_filtered_data
+import pandas as pd
+from core import (
+    AGE_ORDER,
+    EDA_HIST_LABELS,
+    get_theme,
+    apply_theme_css,
+    get_filters,
+    filtered_count,
+    eda_summaries,
+)
+
+
+def _bar_spec(
+    x_field: str,
+    x_type: str,
+    x_title: str | None,
+    y_field: str,
+    y_title: str,
+    x2_field: str | None = None,
+    x_sort: tuple | None = None,
+) -> dict:
+    """Build a Vega-Lite bar spec; data is passed separately per render."""
+    x = {"field": x_field, "type": x_type, "title": x_title}
+    if x_sort is not None:
+        x["sort"] = list(x_sort)
+    encoding = {
+        "x": x,
+        "y": {"field": y_field, "type": "quantitative", "title": y_title},
+    }
+    if x2_field is not None:
+        encoding["x2"] = {"field": x2_field}
+    return {"mark": "bar", "encoding": encoding}
+
+
+def _hist_facet_spec() -> dict:
+    """LOS and medication histograms side by side, one facet column each."""
+    return {
+        "facet": {
+            "column": {
+                "field": "variable",
+                "type": "nominal",
+                "title": None,
+                "sort": list(EDA_HIST_LABELS),
+            }
+        },
+        "spec": {
+            "width": 320,
+            **_bar_spec(
+                "bin_start", "quantitative", None, "count", "Count", x2_field="bin_end"
+            ),
+        },
+        "resolve": {"scale": {"x": "independent", "y": "independent"}},
+    }
+
+
+def _hist_chart(hist_bins: pd.DataFrame) -> None:
+    st.subheader("Distribution of Length of Stay and Number of Medications")
+    st.vega_lite_chart(hist_bins, _hist_facet_spec())
+
+
+def _age_chart(age_readmit: pd.DataFrame) -> None:
+    st.subheader("Readmission Rate by Age Group")
+    age_spec = _bar_spec(
+        "age_group",
+        "nominal",
+        "Age Group",
+        "readmitted_30",
+        "30-Day Readmission Rate (%)",
+        x_sort=AGE_ORDER,
+    )
+    st.vega_lite_chart(age_readmit, age_spec, use_container_width=True)
+
 
 theme = get_theme(False)
 apply_theme_css(theme)
 
 st.title("Exploratory Data Analysis (EDA)")
 
-df = get_filtered_data()
+filters = get_filters()
 
-if df.empty:
+if filtered_count(*filters) == 0:
     st.info("No data for the current filter selection.")
-else:
-    st.subheader("Distribution of Length of Stay")
-    los_chart = (
-        alt.Chart(df)
-        .mark_bar()
-        .encode(
-            x=alt.X("time_in_hospital:Q", bin=alt.Bin(maxbins=20), title="LOS (days)"),
-            y=alt.Y("count():Q", title="Count"),
-        )
-    )
-    st.altair_chart(los_chart, use_container_width=True)
-
-    st.subheader("Distribution of Number of Medications")
-    meds_chart = (
-        alt.Chart(df)
-        .mark_bar()
-        .encode(
-            x=alt.X("num_medications:Q", bin=alt.Bin(maxbins=30), title="Number of Medications"),
-            y=alt.Y("count():Q", title="Count"),
-        )
-    )
-    st.altair_chart(meds_chart, use_container_width=True)
+    st.stop()
 
-    st.subheader("Readmission Rate by Age Group")
-    age_readmit = (
-        df.assign(readmitted_30=lambda d: d["readmitted"] == "<30")
-        .groupby("age_group")["readmitted_30"]
-        .mean()
-        .reset_index()
-    )
-    age_readmit["readmitted_30"] *= 100
-    age_chart = (
-        alt.Chart(age_readmit)
-        .mark_bar()
-        .encode(
-            x=alt.X("age_group:N", title="Age Group", sort=None),
-            y=alt.Y("readmitted_30:Q", title="30-Day Readmission Rate (%)"),
-        )
-    )
-    st.altair_chart(age_chart, use_container_width=True)
+hist_bins, age_readmit = eda_summaries(*filters)
+
+_hist_chart(hist_bins)
+_age_chart(age_readmit)
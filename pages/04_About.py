@@ -4,59 +4,63 @@ import streamlit as st
 # ABOUT PAGE
 # ----------------------------
 
-st.title("About This Dashboard")
 
-st.write(
-    """
-This dashboard analyzes diabetic inpatient encounters, focusing specifically on  
-**30-day readmissions**, **length of stay**, and **polypharmacy patterns** among patients.  
-It provides an interactive environment to explore trends across demographics and  
-clinical attributes using filters, KPI cards, and exploratory data analysis.
+@st.cache_data(show_spinner=False)
+def _about_html() -> str:
+    """Static About page content, rendered as a single HTML block."""
+    return """
+<h1>About This Dashboard</h1>
 
-The aim is to support better understanding of readmission risks and medication burden  
+<p>
+This dashboard analyzes diabetic inpatient encounters, focusing specifically on
+<b>30-day readmissions</b>, <b>length of stay</b>, and <b>polypharmacy patterns</b> among patients.
+It provides an interactive environment to explore trends across demographics and
+clinical attributes using filters, KPI cards, and exploratory data analysis.
+</p>
+<p>
+The aim is to support better understanding of readmission risks and medication burden
 within hospital settings.
-"""
-)
+</p>
 
-st.divider()
+<hr>
 
-st.header("Project Information")
+<h2>Project Information</h2>
 
-st.markdown(
-    """
-**Course:** Big Data and Business Intelligence  
-**Cohort:** M.Tech Computer Science: Big Data and AI  
-**University:** SRH University, Leipzig  
-"""
-)
+<p>
+<b>Course:</b> Big Data and Business Intelligence<br>
+<b>Cohort:</b> M.Tech Computer Science: Big Data and AI<br>
+<b>University:</b> SRH University, Leipzig
+</p>
 
-st.divider()
+<hr>
 
-st.header("Author")
+<h2>Author</h2>
 
-st.markdown(
-    """
-**Name:** Abhishek Negi  
-**Matriculation No.:** 100004670  
-**Email:** abhishek.negi53@gmail.com  
-"""
-)
+<p>
+<b>Name:</b> Abhishek Negi<br>
+<b>Matriculation No.:</b> 100004670<br>
+<b>Email:</b> abhishek.negi53@gmail.com
+</p>
+
+<hr>
 
-st.divider()
+<h2>Dataset Source</h2>
 
-st.header("Dataset Source")
+<p style="color:#6b7280; font-size:0.875rem;">
+Dashboard data source: University of California Irvine (UCI) Machine Learning Repository — Diabetes 130-US Hospitals Dataset (Strack et al.)
+</p>
 
-st.caption(
-    "Dashboard data source: University of California Irvine (UCI) Machine Learning Repository — Diabetes 130-US Hospitals Dataset (Strack et al.)"
-)
+<p>
+<b>APA Citation:</b><br>
+Strack, B., DeShazo, J. P., Gennings, C., Olmo, J. L., Ventura, S., Cios, K. J., &amp; Clore, J. N. (2014).<br>
+<i>Impact of HbA1c measurement on hospital readmission rates: Analysis of 70,000 clinical database patient records.</i><br>
+Journal of Clinical Medicine, 3(1), 1–12. <a href="https://doi.org/10.3390/jcm3010001">https://doi.org/10.3390/jcm3010001</a>
+</p>
 
-st.markdown(
-    """
-**APA Citation:**  
-Strack, B., DeShazo, J. P., Gennings, C., Olmo, J. L., Ventura, S., Cios, K. J., & Clore, J. N. (2014).  
-*Impact of HbA1c measurement on hospital readmission rates: Analysis of 70,000 clinical database patient records.*  
-Journal of Clinical Medicine, 3(1), 1–12. https://doi.org/10.3390/jcm3010001
+<div style="background:rgba(33,195,84,0.1); color:#177233; padding:1rem; border-radius:0.5rem;">
+Thank you for viewing this dashboard!
+</div>
 """
-)
 
-st.success("Thank you for viewing this dashboard!")
+
+st.html(_about_html())